@@ -4,18 +4,22 @@
 可読性と処理能力を向上させた版
 """
 
+import io
 import os
+import sys
 import argparse
 import pyperclip
 import json
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from itertools import zip_longest
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Union, Iterator
+from typing import List, Tuple, Optional, Union, Iterator, Iterable
 from PIL import Image
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImageConfig:
     """画像処理設定を管理するデータクラス"""
     pc_image_path: str
@@ -24,19 +28,65 @@ class ImageConfig:
     sp_width: Optional[int] = None
     sp_scale: Optional[float] = None
     media_query: str = "(max-width: 750px)"
+    jpeg_quality: int = 85
+    png_compress_level: int = 1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImageInfo:
     """画像情報を管理するデータクラス"""
     path: str
     width: int
     height: int
+    image: Optional[Image.Image] = None  # リサイズ済み画像（分割・保存で再利用）
     
     @classmethod
-    def from_image(cls, path: str, image: Image.Image) -> 'ImageInfo':
-        """PIL Imageオブジェクトから ImageInfo を作成"""
-        return cls(path=path, width=image.width, height=image.height)
+    def from_image(cls, path: str, image: Image.Image, keep_image: bool = False) -> 'ImageInfo':
+        """PIL Imageオブジェクトから ImageInfo を作成（keep_image=True で画像自体も保持）"""
+        return cls(path=path, width=image.width, height=image.height, image=image if keep_image else None)
+
+
+@dataclass(slots=True, frozen=True)
+class PathInfo:
+    """画像パスの解析結果を管理するデータクラス（実行ごとに1回だけ計算）"""
+    parts: Tuple[str, ...]
+    extension: str
+    wrapper_class: Optional[str]
+    is_first_view: bool
+    is_responsive: bool
+    sp_image_path: Optional[str]
+    base_path: str
+    sub_dir: str
+    relative_path: str
+    
+    @classmethod
+    def from_path(cls, image_path: str) -> 'PathInfo':
+        """画像パスから PathInfo を作成"""
+        parts = Path(image_path).parts
+        
+        # HTMLで参照する基準パスとサブディレクトリを解析
+        if 'pc' in parts:
+            pc_index = parts.index('pc')
+            base_path = '/'.join(parts[:pc_index])
+            sub_dir = '/'.join(parts[pc_index+1:-1])
+        else:
+            images_index = parts.index('images')
+            base_path = '/'.join(parts[:images_index+1])
+            sub_dir = '/'.join(parts[images_index+1:-1])
+        
+        relative_path = "." + base_path[base_path.find("/images"):]
+        
+        return cls(
+            parts=parts,
+            extension=PathUtils.get_file_extension(image_path),
+            wrapper_class=PathUtils.get_wrapper_class(image_path),
+            is_first_view=PathUtils.is_first_view_image(image_path),
+            is_responsive='pc' in parts,
+            sp_image_path=PathUtils.get_sp_image_path(image_path),
+            base_path=base_path,
+            sub_dir=sub_dir,
+            relative_path=relative_path
+        )
 
 
 class PathUtils:
@@ -68,23 +118,26 @@ class PathUtils:
     @staticmethod
     def is_first_view_image(image_path: str) -> bool:
         """ファーストビュー画像かどうかを判定"""
-        return any(fv in image_path for fv in ['/fv/', '/FV/'])
+        return '/fv/' in image_path.lower()
     
     @staticmethod
     def get_sp_image_path(pc_image_path: str) -> Optional[str]:
         """PC画像パスからSP画像パスを生成"""
-        if 'pc' not in pc_image_path:
+        parts = Path(pc_image_path).parts
+        if 'pc' not in parts:
             return None
         
-        sp_path = pc_image_path.replace('/pc/', '/sp/')
+        # pc ディレクトリを sp に置き換える（PathInfo・HTML生成と同じく小文字の pc のみ対象）
+        sp_parts = ['sp' if part == 'pc' else part for part in parts]
+        sp_base, ext = os.path.splitext(str(Path(*sp_parts)))
         
-        # .jpg が存在しない場合は .png を試す
-        if not Path(sp_path).exists():
-            sp_path = sp_path.replace('.jpg', '.png')
-            if not Path(sp_path).exists():
-                return None
+        # 元の拡張子が存在しない場合は .png → .jpg の順に試す
+        for candidate_ext in dict.fromkeys((ext, '.png', '.jpg')):
+            candidate = sp_base + candidate_ext
+            if os.path.exists(candidate):
+                return candidate
         
-        return sp_path
+        return None
 
 
 class ImageProcessor:
@@ -93,6 +146,26 @@ class ImageProcessor:
     DEFAULT_SCALE = 2.0
     DEFAULT_SPLIT_HEIGHT = 200
     OVERLAP_PIXELS = 10
+    REDUCE_MODES = ('L', 'LA', 'RGB', 'RGBA', 'CMYK')
+    
+    @staticmethod
+    def compute_resized_size(
+        width: int, 
+        height: int, 
+        target_width: Optional[int] = None, 
+        scale: Optional[float] = None
+    ) -> Tuple[int, int]:
+        """リサイズ後のサイズを計算（画素には触れない）"""
+        if target_width:
+            resize_scale = target_width / width
+        else:
+            resize_scale = scale or ImageProcessor.DEFAULT_SCALE
+        
+        new_width, new_height = int(width * resize_scale), int(height * resize_scale)
+        if new_width <= 0 or new_height <= 0:
+            raise ValueError(f"リサイズ後のサイズが不正です: {new_width}x{new_height}（横幅・倍率を確認してください）")
+        
+        return new_width, new_height
     
     @staticmethod
     def resize_image(
@@ -101,17 +174,46 @@ class ImageProcessor:
         scale: Optional[float] = None
     ) -> Image.Image:
         """画像をリサイズ"""
-        current_width, current_height = image.size
+        new_size = ImageProcessor.compute_resized_size(image.width, image.height, target_width, scale)
+        return ImageProcessor.resize_to(image, new_size)
+    
+    @staticmethod
+    def resize_to(image: Image.Image, size: Tuple[int, int]) -> Image.Image:
+        """画像を指定サイズにリサイズ"""
+        factor = ImageProcessor._get_reduce_factor(image, size)
+        if factor:
+            # 整数分の1への縮小はボックス平均（reduce）で十分なため LANCZOS を使わない
+            # 割り切れない端の数ピクセルは box で切り捨てる
+            box = (0, 0, size[0] * factor, size[1] * factor)
+            return image.reduce(factor, box=box)
+        
+        return image.resize(size, Image.Resampling.LANCZOS)
+    
+    @staticmethod
+    def _get_reduce_factor(image: Image.Image, size: Tuple[int, int]) -> Optional[int]:
+        """整数分の1への縮小であればその整数を返す"""
+        if image.mode not in ImageProcessor.REDUCE_MODES or size[0] <= 0 or size[1] <= 0:
+            return None
         
-        if target_width:
-            resize_scale = target_width / current_width
-        else:
-            resize_scale = scale or ImageProcessor.DEFAULT_SCALE
+        factor = round(image.width / size[0])
+        if factor < 2:
+            return None
+        
+        if image.width // factor == size[0] and image.height // factor == size[1]:
+            return factor
+        
+        return None
+    
+    @staticmethod
+    def draft_for_resize(image: Image.Image, size: Tuple[int, int]) -> None:
+        """JPEG画像をリサイズ後サイズの2倍を下回らない範囲で縮小デコードするよう設定
         
-        new_width = int(current_width * resize_scale)
-        new_height = int(current_height * resize_scale)
+        画素の読み込み前に呼び出す必要がある。JPEG以外では何もしない。
+        """
+        if image.format != 'JPEG':
+            return
         
-        return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        image.draft('RGB', (size[0] * 2, size[1] * 2))
     
     @staticmethod
     def convert_to_rgb(image: Image.Image) -> Image.Image:
@@ -123,115 +225,142 @@ class ImageProcessor:
         rgb_image.paste(image, mask=image.split()[3])
         return rgb_image
     
+    @staticmethod
+    def save_image(image: Image.Image, path: Path, image_format: str, **save_kwargs) -> None:
+        """画像をメモリ上でエンコードし、まとめてファイルに書き込む"""
+        buffer = io.BytesIO()
+        image.save(buffer, format=image_format, **save_kwargs)
+        data = buffer.getbuffer()
+        
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        # open() と同じく 0o666 を指定し、実際のパーミッションは umask に任せる
+        fd = os.open(path, flags, 0o666)
+        try:
+            written = 0
+            while written < len(data):
+                written += os.write(fd, data[written:])
+        finally:
+            os.close(fd)
+    
     @staticmethod
     def calculate_splits(image_height: int) -> int:
         """画像の高さから分割数を計算"""
         return max(1, image_height // ImageProcessor.DEFAULT_SPLIT_HEIGHT)
     
     @staticmethod
-    def split_image(image: Image.Image, splits: int) -> List[Image.Image]:
-        """画像を指定数に分割"""
+    def split_image(image: Image.Image, splits: int) -> Iterator[Image.Image]:
+        """画像を指定数に分割し、分割画像を1枚ずつ返す"""
         split_height = image.height // splits
-        split_images = []
         
         for i in range(splits):
             top = (i * split_height) - (ImageProcessor.OVERLAP_PIXELS if i > 0 else 0)
             # 最後の分割では画像の実際の高さまで含める
             bottom = image.height if i == splits - 1 else (i + 1) * split_height
             
-            split_img = image.crop((0, top, image.width, bottom))
-            split_images.append(split_img)
-        
-        return split_images
+            yield image.crop((0, top, image.width, bottom))
 
 
 class HTMLGenerator:
     """HTML生成ロジックを管理するクラス"""
     
+    RESPONSIVE_TAG_TEMPLATE = (
+        '<picture style="--h: {height};">\n'
+        '  <source srcset="{sp_prefix}{index}.{ext}" media="{media_query}" />\n'
+        '  <img src="{pc_prefix}{index}.{ext}" alt=""{img_attrs} />\n'
+        '</picture>'
+    )
+    SIMPLE_TAG_TEMPLATE = '<img src="{prefix}{index}.{ext}" style="--h: {height};" alt=""{img_attrs} />'
+    
     @staticmethod
     def create_html_tags(
         splits: int, 
-        pc_image_path: str, 
+        path_info: PathInfo, 
         heights: List[int],
         media_query: str = "(max-width: 750px)"
     ) -> str:
         """HTMLタグを生成"""
-        path_info = HTMLGenerator._parse_image_path(pc_image_path)
-        wrapper_class = PathUtils.get_wrapper_class(pc_image_path)
-        is_first_view = PathUtils.is_first_view_image(pc_image_path)
-        is_responsive = 'pc' in Path(pc_image_path).parts
+        wrapper_class = path_info.wrapper_class
+        relative_path = path_info.relative_path
+        sub_dir = path_info.sub_dir
         
         # 元画像の拡張子に基づいて出力拡張子を決定
-        original_ext = PathUtils.get_file_extension(pc_image_path)
-        output_ext = 'png' if original_ext == '.png' else 'jpg'
+        output_ext = 'png' if path_info.extension == '.png' else 'jpg'
         
         # 画像属性の決定
         img_attrs = ''
         
-        tags = []
+        # 全分割で共通の画像パスの接頭辞はループの外で1回だけ作成
+        sp_prefix = f"{relative_path}/sp/{sub_dir}/"
+        pc_prefix = f"{relative_path}/pc/{sub_dir}/"
+        simple_prefix = f"{relative_path}/{sub_dir}/" if sub_dir else f"{relative_path}/"
         
-        # ラッパーの開始タグ
+        # ラッパーの有無に応じてタグ数分のリストを確保
+        offset = 1 if wrapper_class else 0
+        tags = [''] * (splits + offset * 2)
+        
+        # ラッパーの開始・終了タグ
         if wrapper_class:
-            tags.append(f'<div class="{wrapper_class}">')
+            tags[0] = f'<div class="{wrapper_class}">'
+            tags[-1] = '</div>'
         
         # 画像タグの生成
         for i in range(1, splits + 1):
-            if is_responsive:
+            if path_info.is_responsive:
                 tag = HTMLGenerator._create_responsive_tag(
-                    path_info, i, heights[i-1], img_attrs, output_ext, media_query
+                    sp_prefix, pc_prefix, i, heights[i-1], img_attrs, output_ext, media_query
                 )
             else:
                 tag = HTMLGenerator._create_simple_tag(
-                    path_info, i, heights[i-1], img_attrs, output_ext
+                    simple_prefix, i, heights[i-1], img_attrs, output_ext
                 )
-            tags.append(tag)
-        
-        # ラッパーの終了タグ
-        if wrapper_class:
-            tags.append('</div>')
+            tags[offset + i - 1] = tag
         
         return '\n'.join(tags)
     
     @staticmethod
-    def _parse_image_path(pc_image_path: str) -> dict:
-        """画像パスを解析してパス情報を取得"""
-        parts = Path(pc_image_path).parts
-        
-        if 'pc' in parts:
-            pc_index = parts.index('pc')
-            base_path = '/'.join(parts[:pc_index])
-            sub_dir = '/'.join(parts[pc_index+1:-1])
-        else:
-            images_index = parts.index('images')
-            base_path = '/'.join(parts[:images_index+1])
-            sub_dir = '/'.join(parts[images_index+1:-1])
-        
-        relative_path = "." + base_path[base_path.find("/images"):]
-        
-        return {
-            'relative_path': relative_path,
-            'sub_dir': sub_dir
-        }
-    
-    @staticmethod
-    def _create_responsive_tag(path_info: dict, index: int, height: int, img_attrs: str, output_ext: str, media_query: str = "(max-width: 750px)") -> str:
+    def _create_responsive_tag(sp_prefix: str, pc_prefix: str, index: int, height: int, img_attrs: str, output_ext: str, media_query: str = "(max-width: 750px)") -> str:
         """レスポンシブ画像タグを生成"""
-        relative_path = path_info['relative_path']
-        sub_dir = path_info['sub_dir']
-        
-        return f'''<picture style="--h: {height / 2};">
-  <source srcset="{relative_path}/sp/{sub_dir}/{index}.{output_ext}" media="{media_query}" />
-  <img src="{relative_path}/pc/{sub_dir}/{index}.{output_ext}" alt=""{img_attrs} />
-</picture>'''
+        return HTMLGenerator.RESPONSIVE_TAG_TEMPLATE.format(
+            height=height / 2, sp_prefix=sp_prefix, pc_prefix=pc_prefix,
+            index=index, ext=output_ext, media_query=media_query, img_attrs=img_attrs
+        )
     
     @staticmethod
-    def _create_simple_tag(path_info: dict, index: int, height: int, img_attrs: str, output_ext: str) -> str:
+    def _create_simple_tag(prefix: str, index: int, height: int, img_attrs: str, output_ext: str) -> str:
         """シンプル画像タグを生成"""
-        relative_path = path_info['relative_path']
-        sub_dir = path_info['sub_dir']
-        
-        img_path = f"{relative_path}/{sub_dir}/{index}.{output_ext}" if sub_dir else f"{relative_path}/{index}.{output_ext}"
-        return f'<img src="{img_path}" style="--h: {height / 2};" alt=""{img_attrs} />'
+        return HTMLGenerator.SIMPLE_TAG_TEMPLATE.format(
+            prefix=prefix, index=index, ext=output_ext, height=height / 2, img_attrs=img_attrs
+        )
+
+
+def _copy_to_clipboard(text: str) -> None:
+    """テキストをクリップボードにコピー
+    
+    macOS/Windows ではサブプロセスを起動しないネイティブAPIを使用し、
+    利用できない場合は pyperclip にフォールバックする。
+    """
+    try:
+        if sys.platform == 'darwin':
+            from AppKit import NSPasteboard, NSPasteboardTypeString
+            
+            pasteboard = NSPasteboard.generalPasteboard()
+            pasteboard.clearContents()
+            if pasteboard.setString_forType_(text, NSPasteboardTypeString):
+                return
+        elif sys.platform == 'win32':
+            import win32clipboard
+            
+            win32clipboard.OpenClipboard()
+            try:
+                win32clipboard.EmptyClipboard()
+                win32clipboard.SetClipboardText(text, win32clipboard.CF_UNICODETEXT)
+            finally:
+                win32clipboard.CloseClipboard()
+            return
+    except Exception:
+        pass
+    
+    pyperclip.copy(text)
 
 
 class ImageSplitter:
@@ -240,22 +369,33 @@ class ImageSplitter:
     def __init__(self, config: ImageConfig):
         self.config = config
         self._validate_config()
+        self.path_info = PathInfo.from_path(config.pc_image_path)
     
     def _validate_config(self) -> None:
         """設定の妥当性をチェック"""
         if not Path(self.config.pc_image_path).exists():
             raise FileNotFoundError(f"画像が見つかりません: {self.config.pc_image_path}")
+        
+        # エンコーダ設定は設定ファイル経由でも渡されるため、ファイルを書き込む前に範囲を確認
+        jpeg_quality = self.config.jpeg_quality
+        if not isinstance(jpeg_quality, int) or not 1 <= jpeg_quality <= 95:
+            raise ValueError(f"jpeg_quality は 1〜95 の整数で指定してください: {jpeg_quality}")
+        
+        png_compress_level = self.config.png_compress_level
+        if not isinstance(png_compress_level, int) or not 0 <= png_compress_level <= 9:
+            raise ValueError(f"png_compress_level は 0〜9 の整数で指定してください: {png_compress_level}")
     
     def process(self) -> None:
         """メイン処理"""
+        # 読み込み・リサイズが終わった時点でファイルを閉じ、以降はリサイズ済み画像のみを扱う
         with self._load_images() as (pc_image, sp_image):
             pc_info = self._process_pc_image(pc_image)
             sp_info = self._process_sp_image(sp_image) if sp_image else None
-            
-            splits = ImageProcessor.calculate_splits(pc_info.height)
-            
-            split_heights = self._split_and_save_images(pc_info, sp_info, splits)
-            self._generate_html_output(splits, split_heights)
+        
+        splits = ImageProcessor.calculate_splits(pc_info.height)
+        
+        split_heights = self._split_and_save_images(pc_info, sp_info, splits)
+        self._generate_html_output(splits, split_heights)
     
     @contextmanager
     def _load_images(self) -> Iterator[Tuple[Image.Image, Optional[Image.Image]]]:
@@ -264,7 +404,7 @@ class ImageSplitter:
         sp_image = None
         
         try:
-            sp_path = PathUtils.get_sp_image_path(self.config.pc_image_path)
+            sp_path = self.path_info.sp_image_path
             if sp_path:
                 sp_image = Image.open(sp_path)
             
@@ -279,8 +419,16 @@ class ImageSplitter:
         original_info = ImageInfo.from_image(self.config.pc_image_path, image)
         print(f"PC画像 元のサイズ: {original_info.width}x{original_info.height}")
         
-        resized_image = ImageProcessor.resize_image(image, self.config.width, self.config.scale)
-        resized_info = ImageInfo.from_image(self.config.pc_image_path, resized_image)
+        new_size = ImageProcessor.compute_resized_size(
+            image.width, image.height, self.config.width, self.config.scale
+        )
+        # 縮小デコード後もサイズがずれないよう計算済みのサイズでリサイズ
+        ImageProcessor.draft_for_resize(image, new_size)
+        # リサイズ前にデコードを完了させる（単一フレーム画像はここでファイルが閉じられる）
+        image.load()
+        resized_image = ImageProcessor.resize_to(image, new_size)
+        
+        resized_info = ImageInfo.from_image(self.config.pc_image_path, resized_image, keep_image=True)
         print(f"PC画像 新しいサイズ: {resized_info.width}x{resized_info.height}")
         
         return resized_info
@@ -293,73 +441,92 @@ class ImageSplitter:
         original_info = ImageInfo.from_image("", image)
         print(f"SP画像 元のサイズ: {original_info.width}x{original_info.height}")
         
-        resized_image = ImageProcessor.resize_image(image, self.config.sp_width, self.config.sp_scale)
-        resized_info = ImageInfo.from_image("", resized_image)
+        new_size = ImageProcessor.compute_resized_size(
+            image.width, image.height, self.config.sp_width, self.config.sp_scale
+        )
+        ImageProcessor.draft_for_resize(image, new_size)
+        image.load()
+        resized_image = ImageProcessor.resize_to(image, new_size)
+        
+        resized_info = ImageInfo.from_image("", resized_image, keep_image=True)
         print(f"SP画像 新しいサイズ: {resized_info.width}x{resized_info.height}")
         
         return resized_info
     
+    def _get_output_ext(self) -> str:
+        """元画像の拡張子に基づいて出力拡張子を決定"""
+        return '.png' if self.path_info.extension == '.png' else '.jpg'
+    
     def _split_and_save_images(
         self, 
         pc_info: ImageInfo, 
         sp_info: Optional[ImageInfo], 
         splits: int
     ) -> List[int]:
-        """画像を分割して保存"""
-        with self._load_images() as (pc_image, sp_image):
-            # 画像をリサイズ
-            pc_resized = ImageProcessor.resize_image(pc_image, self.config.width, self.config.scale)
-            sp_resized = None
-            if sp_image:
-                sp_resized = ImageProcessor.resize_image(sp_image, self.config.sp_width, self.config.sp_scale)
-            
-            # 分割
-            pc_splits = ImageProcessor.split_image(pc_resized, splits)
-            sp_splits = ImageProcessor.split_image(sp_resized, splits) if sp_resized else []
-            
-            # 保存
-            return self._save_split_images(pc_splits, sp_splits)
+        """リサイズ済み画像を分割して保存"""
+        pc_image = pc_info.image
+        sp_image = sp_info.image if sp_info else None
+        
+        # JPG出力の場合は分割前に画像全体を1回だけRGB変換
+        if self._get_output_ext() == '.jpg':
+            pc_image = ImageProcessor.convert_to_rgb(pc_image)
+            sp_image = ImageProcessor.convert_to_rgb(sp_image) if sp_image else None
+        
+        # 分割（保存と並行して1枚ずつ作成）
+        pc_splits = ImageProcessor.split_image(pc_image, splits)
+        sp_splits = ImageProcessor.split_image(sp_image, splits) if sp_image else None
+        
+        # 保存
+        return self._save_split_images(pc_splits, sp_splits)
     
     def _save_split_images(
         self, 
-        pc_splits: List[Image.Image], 
-        sp_splits: List[Image.Image]
+        pc_splits: Iterable[Image.Image], 
+        sp_splits: Optional[Iterable[Image.Image]]
     ) -> List[int]:
         """分割画像を保存"""
         pc_dir = Path(self.config.pc_image_path).parent
         sp_dir = None
         
-        # 元画像の拡張子を取得
-        original_ext = PathUtils.get_file_extension(self.config.pc_image_path)
-        output_ext = '.png' if original_ext == '.png' else '.jpg'
+        output_ext = self._get_output_ext()
+        
+        # エンコーダ設定（JPEGは4:2:0サブサンプリング、PNGは高速な圧縮レベル）
+        image_format = 'PNG' if output_ext == '.png' else 'JPEG'
+        if output_ext == '.png':
+            save_kwargs = {'compress_level': self.config.png_compress_level}
+        else:
+            save_kwargs = {'quality': self.config.jpeg_quality, 'subsampling': '4:2:0', 'optimize': False}
         
-        if sp_splits:
-            sp_path = PathUtils.get_sp_image_path(self.config.pc_image_path)
+        if sp_splits is not None:
+            sp_path = self.path_info.sp_image_path
             if sp_path:
                 sp_dir = Path(sp_path).parent
                 sp_dir.mkdir(parents=True, exist_ok=True)
         
         split_heights = []
         
-        for i, pc_split in enumerate(pc_splits, 1):
-            # PC画像保存
-            if output_ext == '.png':
-                # PNG形式で保存（透明度を保持）
-                pc_split.save(pc_dir / f"{i}.png")
-            else:
-                # JPG形式で保存（RGB変換）
-                pc_rgb = ImageProcessor.convert_to_rgb(pc_split)
-                pc_rgb.save(pc_dir / f"{i}.jpg")
+        # エンコード中はGILが解放されるため、スレッドで並列に保存
+        # 分割画像は作成できたものから順に投入し、次の分割画像の作成とエンコードを重ねる
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = []
             
-            # SP画像保存
-            if sp_splits and i <= len(sp_splits):
-                if output_ext == '.png':
-                    sp_splits[i-1].save(sp_dir / f"{i}.png")
-                else:
-                    sp_rgb = ImageProcessor.convert_to_rgb(sp_splits[i-1])
-                    sp_rgb.save(sp_dir / f"{i}.jpg")
+            for i, (pc_split, sp_split) in enumerate(zip_longest(pc_splits, sp_splits or ()), 1):
+                # PC画像保存（PNGは透明度を保持、JPGは分割前にRGB変換済み）
+                futures.append(executor.submit(
+                    ImageProcessor.save_image, pc_split, pc_dir / f"{i}{output_ext}", image_format, **save_kwargs
+                ))
+                
+                # SP画像保存
+                if sp_split is not None:
+                    futures.append(executor.submit(
+                        ImageProcessor.save_image, sp_split, sp_dir / f"{i}{output_ext}", image_format, **save_kwargs
+                    ))
+                
+                split_heights.append(pc_split.height)
             
-            split_heights.append(pc_split.height)
+            # 保存時の例外を呼び出し元に伝える
+            for future in futures:
+                future.result()
         
         return split_heights
     
@@ -367,18 +534,31 @@ class ImageSplitter:
         """HTML出力を生成"""
         html_tags = HTMLGenerator.create_html_tags(
             splits, 
-            self.config.pc_image_path, 
+            self.path_info, 
             split_heights,
             self.config.media_query
         )
         
-        pyperclip.copy(html_tags)
+        _copy_to_clipboard(html_tags)
         
         # 結果表示
         print(f"\n{splits}分割のHTMLタグをクリップボードにコピーしました。")
     
 
 
+def _int_in_range(min_value: int, max_value: int):
+    """指定範囲の整数のみを受け付ける argparse 用の型を作成"""
+    def parse(value: str) -> int:
+        number = int(value)
+        if not min_value <= number <= max_value:
+            raise argparse.ArgumentTypeError(f"{min_value}〜{max_value} の整数で指定してください: {value}")
+        return number
+    
+    # argparse のエラーメッセージで "invalid int value" と表示させる
+    parse.__name__ = 'int'
+    return parse
+
+
 def create_argument_parser() -> argparse.ArgumentParser:
     """コマンドライン引数パーサーを作成"""
     parser = argparse.ArgumentParser(description='画像のリサイズと分割を行います（リファクタリング版）')
@@ -396,6 +576,10 @@ def create_argument_parser() -> argparse.ArgumentParser:
     parser.add_argument('--media', type=str, default='(max-width: 750px)', help='pictureタグのsourceのmedia属性（デフォルト: (max-width: 750px)）')
     parser.add_argument('--config', type=str, help='設定ファイルのパス（JSON形式）')
 
+    # 保存関連の引数
+    parser.add_argument('--jpeg-quality', type=_int_in_range(1, 95), default=85, help='JPEG保存時の品質 1〜95（デフォルト: 85）')
+    parser.add_argument('--png-compress-level', type=_int_in_range(0, 9), default=1, help='PNG保存時の圧縮レベル 0〜9（デフォルト: 1）')
+
     return parser
 
 
@@ -421,7 +605,9 @@ def merge_config(args: argparse.Namespace, config_data: dict) -> ImageConfig:
         scale=config_data.get('scale', args.scale),
         sp_width=config_data.get('sp_width', args.sp_width),
         sp_scale=config_data.get('sp_scale', args.sp_scale),
-        media_query=config_data.get('media', args.media)
+        media_query=config_data.get('media', args.media),
+        jpeg_quality=config_data.get('jpeg_quality', args.jpeg_quality),
+        png_compress_level=config_data.get('png_compress_level', args.png_compress_level)
     )
 
 